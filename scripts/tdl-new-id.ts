@@ -4,7 +4,8 @@
  * Generate a new random TDL document ID (base36, lowercase).
  * - Uniform randomness via rejection sampling (no modulo bias)
  * - Single-pass scan of docs to collect used IDs (no re-scan per attempt)
- * - Strict path matching on segment boundaries
+ * - Prunes template and hidden directories during traversal
+ * - Strict ID matching on entry names (one path segment at a time)
  *
  * Environment Variables:
  *   ID_LEN   - ID length (default: 5, min: 1)
@@ -26,9 +27,26 @@ export const DEFAULT_ID_LENGTH = 5;
 // Valid TDL prefixes
 export const VALID_PREFIXES = ["AN", "FR", "NFR", "ADR", "T"] as const;
 
+// Subdirectories of the docs root where TDL IDs are assigned. Archived
+// documents use legacy numeric names, so other subtrees cannot collide.
+export const TDL_SUBDIRS = [
+  "analysis",
+  "requirements",
+  "adr",
+  "tasks",
+] as const;
+
 // Alphabet: 0-9, a-z
 const ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz" as const;
 
+// ID extraction pattern, precompiled once at module load. Multiline so one
+// pass over a newline-joined batch of entry names matches each name start.
+// e.g., requirements/FR-v7ql4-cache-locking.md or tasks/T-e7fa1-impl/
+const ID_PATTERN = new RegExp(
+  String.raw`^(?:${VALID_PREFIXES.join("|")})-([0-9a-z]+)-`,
+  "gm",
+);
+
 /**
  * Uniform random integer generator in [0, max).
  * Uses rejection sampling over a single random byte.
@@ -58,9 +76,10 @@ export function generateId(length: number = DEFAULT_ID_LENGTH): string {
 }
 
 /**
- * Recursively walk a directory tree using Dirent entries (no extra stat calls).
+ * Recursively walk a directory tree, yielding Dirent entries (no extra stat
+ * calls). Prunes template and hidden directories, which never contain TDL IDs.
  */
-export function* walkPaths(rootDir: string): Generator<string> {
+export function* walkEntries(rootDir: string): Generator<Dirent> {
   if (!existsSync(rootDir)) return;
   const stack: string[] = [rootDir];
   while (stack.length) {
@@ -73,36 +92,35 @@ export function* walkPaths(rootDir: string): Generator<string> {
       continue;
     }
     for (const dirent of entries) {
-      const entryPath = join(current, dirent.name);
-      yield entryPath;
-      if (dirent.isDirectory()) stack.push(entryPath);
+      if (dirent.name.startsWith(".") || dirent.name === "templates") continue;
+      yield dirent;
+      if (dirent.isDirectory()) stack.push(join(current, dirent.name));
     }
   }
 }
 
 /**
  * Collect all used IDs from filenames/dirnames under the given root.
- * Matches segment-boundary patterns: (AN|FR|NFR|ADR|T)-<id>-
+ * Matches name-anchored patterns: (AN|FR|NFR|ADR|T)-<id>-
+ * Only the subdirectories that can hold TDL documents are scanned.
  */
 export function collectUsedIds(rootDir: string): Set<string> {
   const used = new Set<string>();
   if (!existsSync(rootDir)) return used;
 
-  // e.g., .../requirements/FR-v7ql4-cache-locking.md or .../T-e7fa1-impl/
-  const idPattern = new RegExp(
-    String.raw`(?:^|[\\/])(?:${VALID_PREFIXES.join("|")})-([0-9a-z]+)-`,
-    "g",
-  );
-
-  for (const p of walkPaths(rootDir)) {
-    let m: RegExpExecArray | null;
-    idPattern.lastIndex = 0; // reset for safety across loop
-    for (;;) {
-      m = idPattern.exec(p);
-      if (m === null) break;
-      used.add(m[1]);
+  const names: string[] = [];
+  for (const sub of TDL_SUBDIRS) {
+    for (const dirent of walkEntries(join(rootDir, sub))) {
+      names.push(dirent.name);
     }
   }
+  if (names.length === 0) return used;
+
+  // Join the collected names and let the regex engine sweep the whole batch
+  // in one call instead of dispatching an exec per entry.
+  for (const m of names.join("\n").matchAll(ID_PATTERN)) {
+    used.add(m[1]);
+  }
   return used;
 }
 
@@ -27,7 +27,9 @@ import {
   findHeadingMismatches,
   inferDocumentType,
   loadDocuments,
+  loadDocumentsConcurrently,
   main,
+  makeTDLDocumentFromContent,
   parseArgs,
   parseDocumentLinks,
   checkIntegrity,
@@ -567,6 +569,24 @@ describe("extractDocumentStatus", () => {
   });
 });
 
+describe("makeTDLDocumentFromContent", () => {
+  it("falls back to Unknown when a status line straddles the head bound", () => {
+    const headLimit = 4096;
+    const heading = "# FR-0400 Bounded Requirement\n\n## Metadata\n";
+    const statusLine = "- Status: Implemented";
+    // Size the filler so the head bound falls inside the status value
+    const fillerLength = headLimit - heading.length - statusLine.length + 8;
+    const content = `${heading}${"x".repeat(fillerLength)}\n${statusLine}\n`;
+
+    const doc = makeTDLDocumentFromContent(
+      "/repo/docs/requirements/FR-0400-bounded.md",
+      content,
+    );
+
+    expect(doc.status).toBe("Unknown");
+  });
+});
+
 describe("extractDocumentTitle", () => {
   it("extracts first heading", () => {
     const title = extractDocumentTitle("# Heading\nMore text");
@@ -619,6 +639,83 @@ describe("safeReadFile", () => {
   });
 });
 
+describe("loadDocumentsConcurrently", () => {
+  it("produces the same document map as the synchronous loader", async () => {
+    const repoRoot = createTempDir();
+    writeDoc(
+      repoRoot,
+      "docs/analysis/AN-0300-loader.md",
+      analysisDoc({
+        id: "AN-0300",
+        title: "Loader Analysis",
+        status: "Complete",
+        relatedRequirements: ["FR-0300"],
+      }),
+    );
+    writeDoc(
+      repoRoot,
+      "docs/requirements/FR-0300-loader.md",
+      requirementDoc({
+        id: "FR-0300",
+        title: "Loader Requirement",
+        status: "Implemented",
+        tasks: ["T-0300"],
+      }),
+    );
+    writeDoc(
+      repoRoot,
+      "docs/tasks/T-0300-loader/README.md",
+      taskReadmeDoc({ id: "T-0300", title: "Loader Task", status: "Done" }),
+    );
+    writeDoc(
+      repoRoot,
+      "docs/tasks/T-0300-loader/plan.md",
+      taskPlanDoc({ id: "T-0300", title: "Loader Task", status: "Done" }),
+    );
+    writeDoc(
+      repoRoot,
+      "docs/tasks/T-0300-loader/design.md",
+      taskDesignDoc({ id: "T-0300", title: "Loader Task", status: "Done" }),
+    );
+
+    const expected = loadDocuments(repoRoot);
+    const actual = await loadDocumentsConcurrently(repoRoot);
+
+    expect(actual).toEqual(expected);
+  });
+
+  it("warns and skips unreadable files like the synchronous loader", async () => {
+    const repoRoot = createTempDir();
+    writeDoc(
+      repoRoot,
+      "docs/analysis/AN-0301-loader.md",
+      analysisDoc({
+        id: "AN-0301",
+        title: "Loader Analysis",
+        status: "Complete",
+      }),
+    );
+    // A directory where a document file is expected makes the read fail
+    mkdirSync(join(repoRoot, "docs", "tasks", "T-0301-broken", "plan.md"), {
+      recursive: true,
+    });
+
+    const errors: unknown[][] = [];
+    const originalError = console.error;
+    console.error = (...args: unknown[]) => {
+      errors.push(args);
+    };
+    try {
+      const documents = await loadDocumentsConcurrently(repoRoot);
+      expect([...documents.keys()]).toEqual(["AN-0301"]);
+      expect(errors.length).toBe(1);
+      expect(String(errors[0][0])).toContain("Warning: Failed to read");
+    } finally {
+      console.error = originalError;
+    }
+  });
+});
+
 describe("walkFiles", () => {
   it("yields only files and respects recursion flag", () => {
     const root = createTempDir();
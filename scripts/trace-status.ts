@@ -13,6 +13,8 @@ import {
   readFileSync,
   writeFileSync,
 } from "node:fs";
+import { readFile } from "node:fs/promises";
+import { availableParallelism } from "node:os";
 import { dirname, join, relative, resolve, sep } from "node:path";
 import process from "node:process";
 
@@ -24,20 +26,23 @@ export type DocumentType =
   | "unknown";
 type LinkMap = Record<string, string[]>;
 
+// Fixed-shape record: every construction site fills all fields in the same
+// order, so the runtime can keep one hidden class for all coverage reports.
 export type CoverageReport = {
-  total_requirements: number;
-  total_tasks: number;
-  total_analyses: number;
-  total_adrs: number;
-  requirements_with_tasks: number;
-  coverage_percentage: number;
+  readonly total_requirements: number;
+  readonly total_tasks: number;
+  readonly total_analyses: number;
+  readonly total_adrs: number;
+  readonly requirements_with_tasks: number;
+  readonly coverage_percentage: number;
 };
 
-type DocSource = {
-  baseDir: string;
-  recursive: boolean;
-  match: (relativePath: string) => boolean;
-};
+// Document filenames recognised inside each docs/tasks/<task-dir>/ directory
+const TASK_DOCUMENT_NAMES: readonly string[] = [
+  "plan.md",
+  "design.md",
+  "README.md",
+];
 
 function ensureSet(map: Map<string, Set<string>>, key: string): Set<string> {
   let bucket = map.get(key);
@@ -244,6 +249,7 @@ export type DocumentSourceInfo = {
   readonly path: string;
   readonly filename: string;
   readonly headingId: string | null;
+  readonly links: LinkMap;
 };
 
 export type TDLDocument = {
@@ -259,24 +265,37 @@ export type TDLDocument = {
 };
 
 export function makeTDLDocument(filePath: string): TDLDocument {
+  // Paths come from directory enumeration, so reads succeed in the common
+  // case; loaders guard the rare failure instead of every helper.
+  return makeTDLDocumentFromContent(filePath, readFileSync(filePath, "utf8"));
+}
+
+export function makeTDLDocumentFromContent(
+  filePath: string,
+  content: string | null,
+): TDLDocument {
   const filename = filePath.split(/[/\\]/).pop() ?? filePath;
-  const content = safeReadFile(filePath);
   const docId = extractDocumentId(filename, filePath, content);
   const headingId = extractFirstLineId(content);
+  // Parse the Links section once and share it between the document and its
+  // source record so later checks never re-read the file.
+  const links = parseDocumentLinks(content);
+  const metadataHead = content === null ? null : boundedMetadataHead(content);
   return {
     path: filePath,
     filename,
     docId,
     docType: inferDocumentType(filename, filePath),
-    links: parseDocumentLinks(content),
-    status: extractDocumentStatus(content),
-    metadataType: extractDocumentMetadataType(content),
+    links,
+    status: extractDocumentStatus(metadataHead),
+    metadataType: extractDocumentMetadataType(metadataHead),
     title: extractDocumentTitle(content),
     sources: [
       {
         path: filePath,
         filename,
         headingId,
+        links,
       },
     ],
   };
@@ -421,34 +440,72 @@ function metadataPriority(doc: TDLDocument, metadataType: string): number {
   return base + documentSourcePriority(doc);
 }
 
+// Document parsing patterns, compiled once at module load. These run for
+// every scanned markdown file, so avoid rebuilding them per call.
+const FILENAME_ID_RE = /^([A-Z]+-[^-]+)/;
+const PATH_ID_RE = /([A-Z]+-[0-9a-z]+)(?=[-./\\]|$)/;
+const METADATA_ID_RE = /^\s*-\s*ID:\s*([A-Z]+-[^\s]+)/im;
+const LINKS_SECTION_RE = /## Links\s*\n([\s\S]*?)(?=\n##|$)/;
+const LINE_SPLIT_RE = /\r?\n/;
+const STATUS_LINE_RE = /^\s*-\s*Status:\s*(.+)$/m;
+const METADATA_TYPE_RE = /^\s*-\s*Type:\s*(.+)$/m;
+const TITLE_LINE_RE = /^#\s+(.+)$/m;
+const BOM_RE = /^\uFEFF/;
+const HEADING_ID_RE = /^#\s+([A-Z]+-[0-9A-Za-z]+)/;
+const LEADING_ID_RE = /^([A-Z]+-[0-9A-Za-z]+)/;
+const CODE_PLACEHOLDER_RE = /^`.*`$/;
+const BRACKET_PLACEHOLDER_RE = /^\[.*\]$/;
+const LINK_ID_RE = /\b[A-Z]+-[0-9a-z]+\b/g;
+const DOC_ID_SHAPE_RE = /^[A-Z]+-[0-9A-Za-z]+$/;
+const ID_SUFFIX_RE = /^(AN|FR|NFR|ADR|T)-([0-9A-Za-z]+)/;
+
+// TDL documents keep their Metadata section at the top, so the status and
+// type scans only need the head of the file rather than the whole content.
+const METADATA_HEAD_CHARS = 4096;
+
+// Trim the bounded head to the last complete line so a metadata entry that
+// straddles the cutoff can never match with a truncated value.
+function boundedMetadataHead(content: string): string {
+  if (content.length <= METADATA_HEAD_CHARS) return content;
+  const head = content.slice(0, METADATA_HEAD_CHARS);
+  return head.slice(0, head.lastIndexOf("\n") + 1);
+}
+
 export function extractDocumentId(
   filename: string,
   filePath: string,
   content: string | null,
 ): string {
-  const directMatch = filename.match(/^([A-Z]+-[^-]+)/);
+  const directMatch = filename.match(FILENAME_ID_RE);
   if (directMatch) return directMatch[1];
 
-  const pathMatch = filePath.match(/([A-Z]+-[0-9a-z]+)(?=[-./\\]|$)/);
+  const pathMatch = filePath.match(PATH_ID_RE);
   if (pathMatch) return pathMatch[1];
 
   if (content) {
-    const metadataMatch = content.match(/^\s*-\s*ID:\s*([A-Z]+-[^\s]+)/im);
+    const metadataMatch = content.match(METADATA_ID_RE);
     if (metadataMatch) return metadataMatch[1];
   }
 
   return filename;
 }
 
+// Prefix dispatch table; NFR- precedes FR- so neither can shadow the other
+const DOC_TYPE_BY_PREFIX: readonly (readonly [string, DocumentType])[] = [
+  ["NFR-", "requirement"],
+  ["FR-", "requirement"],
+  ["AN-", "analysis"],
+  ["ADR-", "adr"],
+  ["T-", "task"],
+];
+
 export function inferDocumentType(
   filename: string,
   filePath: string,
 ): DocumentType {
-  if (filename.startsWith("AN-")) return "analysis";
-  if (filename.startsWith("FR-")) return "requirement";
-  if (filename.startsWith("NFR-")) return "requirement";
-  if (filename.startsWith("ADR-")) return "adr";
-  if (filename.startsWith("T-")) return "task";
+  for (const [prefix, docType] of DOC_TYPE_BY_PREFIX) {
+    if (filename.startsWith(prefix)) return docType;
+  }
   const normalizedPath = filePath.replace(/\\/g, "/");
   if (normalizedPath.includes("docs/tasks/T-")) return "task";
   return "unknown";
@@ -458,11 +515,11 @@ export function parseDocumentLinks(content: string | null): LinkMap {
   const links: LinkMap = {};
   if (content === null) return links;
 
-  const linksMatch = content.match(/## Links\s*\n([\s\S]*?)(?=\n##|$)/);
+  const linksMatch = content.match(LINKS_SECTION_RE);
   if (!linksMatch) return links;
 
   const linksContent = linksMatch[1];
-  const lines = linksContent.split(/\r?\n/);
+  const lines = linksContent.split(LINE_SPLIT_RE);
   let currentLinkType: string | null = null;
   for (const rawLine of lines) {
     const line = rawLine.trim();
@@ -498,14 +555,26 @@ export function parseDocumentLinks(content: string | null): LinkMap {
   return links;
 }
 
+// Status values come from a small vocabulary; pool them so aggregation maps
+// compare a handful of shared strings and no per-document slice keeps its
+// source file's backing buffer alive.
+const STATUS_POOL = new Map<string, string>();
+
+function internStatus(value: string): string {
+  const pooled = STATUS_POOL.get(value);
+  if (pooled !== undefined) return pooled;
+  STATUS_POOL.set(value, value);
+  return value;
+}
+
 export function extractDocumentStatus(content: string | null): string {
   if (content === null) return "Unknown";
 
-  const statusMatch = content.match(/^\s*-\s*Status:\s*(.+)$/m);
+  const statusMatch = content.match(STATUS_LINE_RE);
   if (statusMatch) {
     const raw = statusMatch[1].split("<!--")[0].trim();
     if (isTemplatePlaceholder(raw)) return "Unknown";
-    return raw;
+    return internStatus(raw);
   }
 
   return "Unknown";
@@ -513,21 +582,21 @@ export function extractDocumentStatus(content: string | null): string {
 
 export function extractDocumentTitle(content: string | null): string {
   if (content === null) return "";
-  const match = content.match(/^#\s+(.+)$/m);
+  const match = content.match(TITLE_LINE_RE);
   return match ? match[1].trim() : "";
 }
 
 export function extractFirstLineId(content: string | null): string | null {
   if (content === null) return null;
-  const [firstLineRaw] = content.split(/\r?\n/, 1);
+  const [firstLineRaw] = content.split(LINE_SPLIT_RE, 1);
   if (firstLineRaw === undefined) return null;
-  const firstLine = firstLineRaw.replace(/^\uFEFF/, "").trim();
+  const firstLine = firstLineRaw.replace(BOM_RE, "").trim();
   if (!firstLine) return null;
 
-  const headingMatch = firstLine.match(/^#\s+([A-Z]+-[0-9A-Za-z]+)/);
+  const headingMatch = firstLine.match(HEADING_ID_RE);
   if (headingMatch) return headingMatch[1];
 
-  const idMatch = firstLine.match(/^([A-Z]+-[0-9A-Za-z]+)/);
+  const idMatch = firstLine.match(LEADING_ID_RE);
   if (idMatch) return idMatch[1];
   return null;
 }
@@ -535,7 +604,7 @@ export function extractFirstLineId(content: string | null): string | null {
 export function extractDocumentMetadataType(content: string | null): string {
   if (content === null) return "";
 
-  const typeMatch = content.match(/^\s*-\s*Type:\s*(.+)$/m);
+  const typeMatch = content.match(METADATA_TYPE_RE);
   if (!typeMatch) return "";
 
   const raw = typeMatch[1].split("<!--")[0].trim();
@@ -546,71 +615,143 @@ export function extractDocumentMetadataType(content: string | null): string {
 function isTemplatePlaceholder(value: string): boolean {
   if (!value) return true;
   if (value.includes("|")) return true;
-  if (/^`.*`$/.test(value)) return true;
-  if (/^\[.*\]$/.test(value)) return true;
+  if (CODE_PLACEHOLDER_RE.test(value)) return true;
+  if (BRACKET_PLACEHOLDER_RE.test(value)) return true;
   return false;
 }
 
-export function loadDocuments(repoRoot: string): Map<string, TDLDocument> {
-  const documents = new Map<string, TDLDocument>();
-  const sources: DocSource[] = [
-    {
-      baseDir: join(repoRoot, "docs", "analysis"),
-      recursive: false,
-      match: (p) => p.endsWith(".md"),
-    },
-    {
-      baseDir: join(repoRoot, "docs", "requirements"),
-      recursive: false,
-      match: (p) => p.endsWith(".md"),
-    },
-    {
-      baseDir: join(repoRoot, "docs", "adr"),
-      recursive: false,
-      match: (p) => p.endsWith(".md"),
-    },
-    {
-      baseDir: join(repoRoot, "docs", "tasks"),
-      recursive: true,
-      match: (p) => p.endsWith("plan.md"),
-    },
-    {
-      baseDir: join(repoRoot, "docs", "tasks"),
-      recursive: true,
-      match: (p) => p.endsWith("design.md"),
-    },
-    {
-      baseDir: join(repoRoot, "docs", "tasks"),
-      recursive: true,
-      match: (p) => p.endsWith("README.md"),
-    },
-  ];
+export function collectDocumentPaths(repoRoot: string): string[] {
+  const paths: string[] = [];
 
-  for (const source of sources) {
-    if (!existsSync(source.baseDir)) continue;
-    for (const filePath of walkFiles(source.baseDir, source.recursive)) {
-      if (!source.match(filePath)) continue;
-      if (filePath.includes("traceability.md")) continue;
-      if (
-        filePath.includes(`docs${sep}templates${sep}`) ||
-        filePath.includes("docs/templates/")
-      ) {
-        continue;
-      }
+  // Flat document directories: filter on entry names so paths are only
+  // built for files that will actually be parsed.
+  for (const dirName of ["analysis", "requirements", "adr"]) {
+    const baseDir = join(repoRoot, "docs", dirName);
+    if (!existsSync(baseDir)) continue;
+    for (const entry of readdirSync(baseDir, { withFileTypes: true })) {
+      if (!entry.isFile()) continue;
+      if (!entry.name.endsWith(".md")) continue;
+      if (entry.name === "traceability.md") continue;
+      paths.push(join(baseDir, entry.name));
+    }
+  }
 
-      const doc = makeTDLDocument(filePath);
-      const existing = documents.get(doc.docId);
-      if (existing) {
-        documents.set(doc.docId, mergeTDLDocuments(existing, doc));
-      } else {
-        documents.set(doc.docId, doc);
+  // Task documents sit in a fixed two-level layout (docs/tasks/<task-dir>/),
+  // so enumerate it directly instead of walking the subtree once per name.
+  const tasksDir = join(repoRoot, "docs", "tasks");
+  if (existsSync(tasksDir)) {
+    for (const entry of readdirSync(tasksDir, { withFileTypes: true })) {
+      if (entry.isDirectory()) {
+        if (entry.name === "templates") continue;
+        const taskDir = join(tasksDir, entry.name);
+        const names = new Set(readdirSync(taskDir));
+        for (const name of TASK_DOCUMENT_NAMES) {
+          if (names.has(name)) paths.push(join(taskDir, name));
+        }
+      } else if (entry.isFile() && TASK_DOCUMENT_NAMES.includes(entry.name)) {
+        paths.push(join(tasksDir, entry.name));
       }
     }
   }
 
+  return paths;
+}
+
+function insertDocument(
+  documents: Map<string, TDLDocument>,
+  doc: TDLDocument,
+): void {
+  const existing = documents.get(doc.docId);
+  if (existing) {
+    documents.set(doc.docId, mergeTDLDocuments(existing, doc));
+  } else {
+    documents.set(doc.docId, doc);
+  }
+}
+
+export function loadDocuments(repoRoot: string): Map<string, TDLDocument> {
+  const documents = new Map<string, TDLDocument>();
+  for (const filePath of collectDocumentPaths(repoRoot)) {
+    let doc: TDLDocument;
+    try {
+      doc = makeTDLDocument(filePath);
+    } catch (error) {
+      // One unreadable file should not abort the whole run
+      console.error(
+        `Warning: Failed to read ${filePath}: ${(error as Error).message}`,
+      );
+      continue;
+    }
+    insertDocument(documents, doc);
+  }
+  return documents;
+}
+
+// Cap in-flight reads so large docs trees cannot exhaust file descriptors
+const MAX_CONCURRENT_READS = Math.min(32, availableParallelism() * 4);
+
+async function readFilesBounded(
+  paths: readonly string[],
+): Promise<(string | null)[]> {
+  const contents: (string | null)[] = new Array(paths.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < paths.length) {
+      const index = nextIndex;
+      nextIndex += 1;
+      const filePath = paths[index];
+      contents[index] = await readFile(filePath, "utf8").catch(
+        (error: Error) => {
+          console.error(
+            `Warning: Failed to read ${filePath}: ${error.message}`,
+          );
+          return null;
+        },
+      );
+    }
+  };
+
+  const workerCount = Math.min(MAX_CONCURRENT_READS, paths.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return contents;
+}
+
+/**
+ * Load documents with concurrent file reads. Used by the CLI entry point;
+ * a bounded pool of reads overlaps in the thread pool while parsing and
+ * merging stay in path order so results match the synchronous loader exactly.
+ */
+export async function loadDocumentsConcurrently(
+  repoRoot: string,
+): Promise<Map<string, TDLDocument>> {
+  const paths = collectDocumentPaths(repoRoot);
+  const contents = await readFilesBounded(paths);
+
+  const documents = new Map<string, TDLDocument>();
+  for (let i = 0; i < paths.length; i++) {
+    const content = contents[i];
+    if (content === null) continue;
+    insertDocument(documents, makeTDLDocumentFromContent(paths[i], content));
+  }
   return documents;
 }
 
+export function groupDocumentsByType(
+  documents: Map<string, TDLDocument>,
+): Map<DocumentType, TDLDocument[]> {
+  const byType = new Map<DocumentType, TDLDocument[]>();
+  for (const doc of documents.values()) {
+    let bucket = byType.get(doc.docType);
+    if (!bucket) {
+      bucket = [];
+      byType.set(doc.docType, bucket);
+    }
+    bucket.push(doc);
+  }
+  return byType;
+}
+
 export function requirementDocsFrom(
   documents: Map<string, TDLDocument>,
 ): TDLDocument[] {
@@ -748,6 +889,34 @@ function buildRequirementDependencyInfo(
   };
 }
 
+/**
+ * Derived traceability state that several consumers need. Built once per run
+ * and passed down so the check, print, and render paths do not repeat the
+ * orphan and dependency scans.
+ */
+export type TraceabilityAnalysis = {
+  readonly inboundReferences: InboundReferenceIndex;
+  readonly implementingTasks: ImplementingTaskIndex;
+  readonly dependencies: RequirementDependencyCheckResult;
+  readonly orphanRequirements: string[];
+  readonly orphanAdrs: string[];
+  readonly orphanTasks: string[];
+};
+
+export function buildTraceabilityAnalysis(
+  documents: Map<string, TDLDocument>,
+): TraceabilityAnalysis {
+  const inboundReferences = buildInboundReferenceIndex(documents);
+  return {
+    inboundReferences,
+    implementingTasks: buildImplementingTaskIndex(documents),
+    dependencies: buildRequirementDependencyInfo(documents),
+    orphanRequirements: findOrphanRequirements(documents, inboundReferences),
+    orphanAdrs: findOrphanAdrs(documents, inboundReferences),
+    orphanTasks: findOrphanTasks(documents, inboundReferences),
+  };
+}
+
 export function documentsByLinkingRequirement(
   documents: Map<string, TDLDocument>,
   docType: DocumentType,
@@ -765,34 +934,61 @@ export function documentsByLinkingRequirement(
   return map;
 }
 
-export function findImplementingTasks(
+export type ImplementingTaskIndex = Map<string, string[]>;
+
+export function buildImplementingTaskIndex(
   documents: Map<string, TDLDocument>,
-  reqId: string,
-): string[] {
-  const tasks = new Set<string>();
-  const requirementDoc = documents.get(reqId);
-  if (requirementDoc && requirementDoc.docType === "requirement") {
-    for (const taskId of requirementDoc.links.tasks ?? []) {
+): ImplementingTaskIndex {
+  const tasksByRequirement = new Map<string, Set<string>>();
+
+  const validTaskIds = (ids: string[] | undefined): string[] => {
+    const result: string[] = [];
+    for (const taskId of ids ?? []) {
       const taskDoc = documents.get(taskId);
       if (taskDoc && taskDoc.docType === "task") {
-        tasks.add(taskDoc.docId);
+        result.push(taskDoc.docId);
       }
     }
-  }
+    return result;
+  };
 
   for (const doc of documents.values()) {
-    if (doc.docType !== "adr") continue;
-    const linkedRequirements = doc.links.requirements ?? [];
-    if (!linkedRequirements.includes(reqId)) continue;
-    for (const taskId of doc.links.tasks ?? []) {
-      const taskDoc = documents.get(taskId);
-      if (taskDoc && taskDoc.docType === "task") {
-        tasks.add(taskDoc.docId);
+    if (doc.docType === "requirement") {
+      const taskIds = validTaskIds(doc.links.tasks);
+      if (taskIds.length === 0) continue;
+      const bucket = ensureSet(tasksByRequirement, doc.docId);
+      for (const taskId of taskIds) {
+        bucket.add(taskId);
+      }
+    } else if (doc.docType === "adr") {
+      const taskIds = validTaskIds(doc.links.tasks);
+      if (taskIds.length === 0) continue;
+      for (const reqId of doc.links.requirements ?? []) {
+        const bucket = ensureSet(tasksByRequirement, reqId);
+        for (const taskId of taskIds) {
+          bucket.add(taskId);
+        }
       }
     }
   }
 
-  return [...tasks].sort((a, b) => a.localeCompare(b));
+  const index: ImplementingTaskIndex = new Map();
+  for (const [reqId, taskIds] of tasksByRequirement) {
+    index.set(
+      reqId,
+      [...taskIds].sort((a, b) => a.localeCompare(b)),
+    );
+  }
+  return index;
+}
+
+export function findImplementingTasks(
+  documents: Map<string, TDLDocument>,
+  reqId: string,
+  implementingTasks?: ImplementingTaskIndex,
+): string[] {
+  const index = implementingTasks ?? buildImplementingTaskIndex(documents);
+  return index.get(reqId) ?? [];
 }
 
 export function findOrphanRequirements(
@@ -877,18 +1073,6 @@ function normalizeFilename(name: string): string {
   return name.toLowerCase();
 }
 
-function linksForSource(
-  cache: Map<string, LinkMap>,
-  source: DocumentSourceInfo,
-): LinkMap {
-  const cached = cache.get(source.path);
-  if (cached) return cached;
-  const content = safeReadFile(source.path);
-  const links = parseDocumentLinks(content);
-  cache.set(source.path, links);
-  return links;
-}
-
 export function collectTaskReciprocalLinkIssues(
   documents: Map<string, TDLDocument>,
 ): TaskReciprocalLinkIssue[] {
@@ -945,7 +1129,6 @@ export function collectTaskReciprocalLinkIssues(
 export function collectTaskDesignPlanIssues(
   documents: Map<string, TDLDocument>,
 ): TaskDesignPlanIssue[] {
-  const cache = new Map<string, LinkMap>();
   const issues: TaskDesignPlanIssue[] = [];
 
   for (const taskDoc of taskDocsFrom(documents)) {
@@ -954,7 +1137,7 @@ export function collectTaskDesignPlanIssues(
 
     for (const source of taskDoc.sources) {
       if (normalizeFilename(source.filename) !== "readme.md") continue;
-      const links = linksForSource(cache, source);
+      const links = source.links;
       for (const id of links.designs ?? []) {
         const trimmed = id.trim();
         if (trimmed) referencedDesigns.add(trimmed);
@@ -995,7 +1178,7 @@ export function collectTaskDesignPlanIssues(
 
       const linkedPlans = new Set<string>();
       for (const designSource of designSources) {
-        const links = linksForSource(cache, designSource);
+        const links = designSource.links;
         for (const planId of links.plans ?? []) {
           const trimmed = planId.trim();
           if (trimmed) linkedPlans.add(trimmed);
@@ -1031,7 +1214,7 @@ export function collectTaskDesignPlanIssues(
 
       const linkedDesigns = new Set<string>();
       for (const planSource of planSources) {
-        const links = linksForSource(cache, planSource);
+        const links = planSource.links;
         for (const designId of links.designs ?? []) {
           const trimmed = designId.trim();
           if (trimmed) linkedDesigns.add(trimmed);
@@ -1058,16 +1241,18 @@ export function collectTaskDesignPlanIssues(
 
 export function calculateCoverage(
   documents: Map<string, TDLDocument>,
+  implementingTasks?: ImplementingTaskIndex,
 ): CoverageReport {
-  const requirements = requirementDocsFrom(documents);
-  const tasks = taskDocsFrom(documents);
-  const analyses = [...documents.values()].filter(
-    (doc) => doc.docType === "analysis",
-  );
-  const adrs = [...documents.values()].filter((doc) => doc.docType === "adr");
-
+  // One grouping pass instead of a filter sweep per document type
+  const byType = groupDocumentsByType(documents);
+  const requirements = byType.get("requirement") ?? [];
+  const tasks = byType.get("task") ?? [];
+  const analyses = byType.get("analysis") ?? [];
+  const adrs = byType.get("adr") ?? [];
+
+  const index = implementingTasks ?? buildImplementingTaskIndex(documents);
   const requirementsWithTasks = requirements.filter(
-    (req) => findImplementingTasks(documents, req.docId).length > 0,
+    (req) => (index.get(req.docId)?.length ?? 0) > 0,
   ).length;
   const coveragePercentage = requirements.length
     ? (requirementsWithTasks / requirements.length) * 100
@@ -1171,13 +1356,15 @@ function formatDependencyCell(
 export function renderTraceabilityMarkdown(
   documents: Map<string, TDLDocument>,
   outputPath: string,
+  analysis?: TraceabilityAnalysis,
 ): string {
   const outputDir = dirname(outputPath);
-  const coverage = calculateCoverage(documents);
+  const resolved = analysis ?? buildTraceabilityAnalysis(documents);
+  const { implementingTasks } = resolved;
+  const coverage = calculateCoverage(documents, implementingTasks);
   const requirementDocuments = requirementDocsFrom(documents).sort((a, b) =>
     a.docId.localeCompare(b.docId),
   );
-  const inboundReferences = buildInboundReferenceIndex(documents);
   const analysesByRequirement = documentsByLinkingRequirement(
     documents,
     "analysis",
@@ -1190,7 +1377,7 @@ export function renderTraceabilityMarkdown(
     contradictoryPrereqs,
     contradictoryDependents,
     prerequisiteCycles,
-  } = buildRequirementDependencyInfo(documents);
+  } = resolved.dependencies;
 
   const lines: string[] = [];
   lines.push("# Kopi Traceability Overview");
@@ -1222,7 +1409,7 @@ export function renderTraceabilityMarkdown(
       const requirementLink = formatPrimaryDoc(requirement, outputDir);
 
       const taskIds = new Set<string>();
-      for (const id of findImplementingTasks(documents, requirement.docId)) {
+      for (const id of implementingTasks.get(requirement.docId) ?? []) {
         taskIds.add(id);
       }
       for (const id of requirement.links.tasks ?? []) {
@@ -1381,12 +1568,7 @@ export function renderTraceabilityMarkdown(
   lines.push("");
   lines.push("## Traceability Gaps");
   lines.push("");
-  const orphanRequirements = findOrphanRequirements(
-    documents,
-    inboundReferences,
-  );
-  const orphanAdrs = findOrphanAdrs(documents, inboundReferences);
-  const orphanTasks = findOrphanTasks(documents, inboundReferences);
+  const { orphanRequirements, orphanAdrs, orphanTasks } = resolved;
 
   if (
     orphanRequirements.length === 0 &&
@@ -1429,8 +1611,9 @@ export function renderTraceabilityMarkdown(
 export function writeTraceabilityReport(
   documents: Map<string, TDLDocument>,
   outputPath: string,
+  analysis?: TraceabilityAnalysis,
 ): void {
-  const content = renderTraceabilityMarkdown(documents, outputPath);
+  const content = renderTraceabilityMarkdown(documents, outputPath, analysis);
   mkdirSync(dirname(outputPath), { recursive: true });
   writeFileSync(outputPath, content, "utf8");
 }
@@ -1438,15 +1621,16 @@ export function writeTraceabilityReport(
 export function printStatus(
   documents: Map<string, TDLDocument>,
   showStatusDetails: boolean,
+  analysis?: TraceabilityAnalysis,
 ): void {
+  const resolved = analysis ?? buildTraceabilityAnalysis(documents);
   const {
     missingPrereqs,
     missingDependents,
     contradictoryPrereqs,
     contradictoryDependents,
     prerequisiteCycles,
-  } = buildRequirementDependencyInfo(documents);
-  const inboundReferences = buildInboundReferenceIndex(documents);
+  } = resolved.dependencies;
   const headingMismatches = findHeadingMismatches(documents);
   const reciprocalLinkIssues = collectTaskReciprocalLinkIssues(documents);
   const designPlanIssues = collectTaskDesignPlanIssues(documents);
@@ -1454,7 +1638,7 @@ export function printStatus(
 
   console.log("=== Kopi TDL Status ===\n");
   if (showStatusDetails) {
-    const coverage = calculateCoverage(documents);
+    const coverage = calculateCoverage(documents, resolved.implementingTasks);
     console.log("Coverage:");
     console.log(
       `  Documents: ${coverage.total_analyses} analyses, ${coverage.total_requirements} requirements, ` +
@@ -1467,12 +1651,7 @@ export function printStatus(
     console.log();
   }
 
-  const orphanRequirements = findOrphanRequirements(
-    documents,
-    inboundReferences,
-  );
-  const orphanAdrs = findOrphanAdrs(documents, inboundReferences);
-  const orphanTasks = findOrphanTasks(documents, inboundReferences);
+  const { orphanRequirements, orphanAdrs, orphanTasks } = resolved;
 
   if (orphanRequirements.length || orphanAdrs.length || orphanTasks.length) {
     console.log("Gaps:");
@@ -1604,15 +1783,7 @@ export function printStatus(
 
   if (showStatusDetails) {
     console.log("Status by Document Type:");
-    const byType = new Map<DocumentType, TDLDocument[]>();
-    for (const doc of documents.values()) {
-      let bucket = byType.get(doc.docType);
-      if (!bucket) {
-        bucket = [];
-        byType.set(doc.docType, bucket);
-      }
-      bucket.push(doc);
-    }
+    const byType = groupDocumentsByType(documents);
 
     for (const docType of ["analysis", "requirement", "adr", "task"] as const) {
       if (!byType.has(docType)) continue;
@@ -1642,10 +1813,9 @@ export type HeadingMismatch = {
 export function findHeadingMismatches(
   documents: Map<string, TDLDocument>,
 ): HeadingMismatch[] {
-  const idPattern = /^[A-Z]+-[0-9A-Za-z]+$/;
   const mismatches: HeadingMismatch[] = [];
   for (const doc of documents.values()) {
-    if (!idPattern.test(doc.docId)) continue;
+    if (!DOC_ID_SHAPE_RE.test(doc.docId)) continue;
     if (doc.docType === "unknown") continue;
     for (const source of doc.sources) {
       if (source.headingId === doc.docId) continue;
@@ -1678,7 +1848,7 @@ function formatDuplicateIdIssue(issue: DuplicateIdIssue): string {
 }
 
 function extractIdSuffix(docId: string): string | null {
-  const match = docId.match(/^(AN|FR|NFR|ADR|T)-([0-9A-Za-z]+)/);
+  const match = docId.match(ID_SUFFIX_RE);
   if (!match) return null;
   return match[2].toLowerCase();
 }
@@ -1712,21 +1882,19 @@ function findDuplicateIdIssues(
   return issues.sort((a, b) => a.suffix.localeCompare(b.suffix));
 }
 
-export function checkIntegrity(documents: Map<string, TDLDocument>): boolean {
-  const inboundReferences = buildInboundReferenceIndex(documents);
-  const orphanRequirements = findOrphanRequirements(
-    documents,
-    inboundReferences,
-  );
-  const orphanAdrs = findOrphanAdrs(documents, inboundReferences);
-  const orphanTasks = findOrphanTasks(documents, inboundReferences);
+export function checkIntegrity(
+  documents: Map<string, TDLDocument>,
+  analysis?: TraceabilityAnalysis,
+): boolean {
+  const resolved = analysis ?? buildTraceabilityAnalysis(documents);
+  const { orphanRequirements, orphanAdrs, orphanTasks } = resolved;
   const {
     missingPrereqs,
     missingDependents,
     contradictoryPrereqs,
     contradictoryDependents,
     prerequisiteCycles,
-  } = buildRequirementDependencyInfo(documents);
+  } = resolved.dependencies;
 
   let ok = true;
 
@@ -1879,22 +2047,32 @@ export function* walkFiles(
   }
 }
 
+// Single alternation over all label keywords; longer keywords precede their
+// prefixes so "dependent" wins over "depend" at the same position.
+const LINK_LABEL_KEYWORD_RE =
+  /prerequisite|dependent|depend|analys|adr|design|plan|task|requirement/;
+
+const LINK_TYPE_BY_KEYWORD: Record<string, string> = {
+  prerequisite: "depends_on",
+  dependent: "blocks",
+  depend: "depends_on",
+  analys: "analyses",
+  adr: "adrs",
+  design: "designs",
+  plan: "plans",
+  task: "tasks",
+  requirement: "requirements",
+};
+
 export function resolveLinkType(label: string): string | null {
-  const normalized = label.toLowerCase();
-  if (normalized.includes("prerequisite")) return "depends_on";
-  if (normalized.includes("dependent")) return "blocks";
-  if (normalized.includes("depend")) return "depends_on";
-  if (normalized.includes("analys")) return "analyses";
-  if (normalized.includes("adr")) return "adrs";
-  if (normalized.includes("design")) return "designs";
-  if (normalized.includes("plan")) return "plans";
-  if (normalized.includes("task")) return "tasks";
-  if (normalized.includes("requirement")) return "requirements";
-  return null;
+  // One scan instead of nine substring searches per label. Links labels
+  // contain a single keyword, so match position does not change the outcome.
+  const match = LINK_LABEL_KEYWORD_RE.exec(label.toLowerCase());
+  return match ? LINK_TYPE_BY_KEYWORD[match[0]] : null;
 }
 
 export function extractIds(value: string): string[] {
-  const matches = value.match(/\b[A-Z]+-[0-9a-z]+\b/g);
+  const matches = value.match(LINK_ID_RE);
   return matches ? matches : [];
 }
 
@@ -1973,24 +2151,50 @@ export function parseArgs(argv: string[]): {
 }
 
 export function main(): number {
-  const { checkMode, writePath, showStatusDetails } = parseArgs(
-    process.argv.slice(2),
-  );
+  const options = parseArgs(process.argv.slice(2));
   const repoRoot = findRepoRoot(process.cwd());
   if (!repoRoot) {
     console.error("Error: Could not find repository root");
     return 1;
   }
 
-  const documents = loadDocuments(repoRoot);
+  return runTraceability(loadDocuments(repoRoot), options, repoRoot);
+}
+
+export async function mainAsync(): Promise<number> {
+  const options = parseArgs(process.argv.slice(2));
+  const repoRoot = findRepoRoot(process.cwd());
+  if (!repoRoot) {
+    console.error("Error: Could not find repository root");
+    return 1;
+  }
+
+  return runTraceability(
+    await loadDocumentsConcurrently(repoRoot),
+    options,
+    repoRoot,
+  );
+}
+
+export function runTraceability(
+  documents: Map<string, TDLDocument>,
+  options: {
+    checkMode: boolean;
+    writePath: string | null;
+    showStatusDetails: boolean;
+  },
+  repoRoot: string,
+): number {
+  const { checkMode, writePath, showStatusDetails } = options;
+  const analysis = buildTraceabilityAnalysis(documents);
 
   if (checkMode) {
-    if (!checkIntegrity(documents)) {
+    if (!checkIntegrity(documents, analysis)) {
       return 1;
     }
     if (writePath !== null) {
       const outputPath = resolveOutputPath(writePath, repoRoot);
-      writeTraceabilityReport(documents, outputPath);
+      writeTraceabilityReport(documents, outputPath, analysis);
       console.log(
         `✓ Traceability check passed; report written to ${relative(
           repoRoot,
@@ -2005,13 +2209,13 @@ export function main(): number {
 
   if (writePath !== null) {
     const outputPath = resolveOutputPath(writePath, repoRoot);
-    writeTraceabilityReport(documents, outputPath);
+    writeTraceabilityReport(documents, outputPath, analysis);
     console.log(
       `Traceability report written to ${relative(repoRoot, outputPath)}`,
     );
   }
 
-  printStatus(documents, showStatusDetails);
+  printStatus(documents, showStatusDetails, analysis);
   return 0;
 }
 
@@ -2026,5 +2230,5 @@ export function toPosixPath(pathValue: string): string {
 }
 
 if (import.meta.main) {
-  process.exit(main());
+  process.exit(await mainAsync());
 }